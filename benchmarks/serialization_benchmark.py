@@ -0,0 +1,105 @@
+"""
+Benchmark record encoding throughput.
+
+Compares the previous store path (pydantic ``vezilka_schemas.Record`` ->
+``to_dict()`` -> ``json.dump``) with the slotted ``scraper.models.Record``
+encoded through ``store.serializer``.
+
+Usage:
+    python -m benchmarks.serialization_benchmark [--records N] [--repeat N]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+
+import vezilka_schemas
+
+from scraper.models import Record, RecordMeta
+from store import serializer
+
+SAMPLE_TEXT = "Здраво на сите, дали некој има искуство со ова? " * 20
+
+
+def _build_schema_records(count: int) -> list:
+    now = datetime.now()
+    return [
+        vezilka_schemas.Record(
+            id=str(i),
+            text=SAMPLE_TEXT,
+            type=vezilka_schemas.RecordType.NARRATIVE,
+            last_modified_at=now,
+            meta=vezilka_schemas.RecordMeta(
+                source="https://forum.femina.mk/",
+                url=f"https://forum.femina.mk/threads/thread.{i}/",
+                tags=["Здравје"],
+                labels=[],
+                scraped_at=now,
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def _build_compact_records(count: int) -> list:
+    now = datetime.now()
+    return [
+        Record(
+            id=str(i),
+            text=SAMPLE_TEXT,
+            type=vezilka_schemas.RecordType.NARRATIVE,
+            last_modified_at=now,
+            meta=RecordMeta(
+                source="https://forum.femina.mk/",
+                url=f"https://forum.femina.mk/threads/thread.{i}/",
+                tags=["Здравје"],
+                labels=[],
+                scraped_at=now,
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def _encode_legacy(records: list) -> bytes:
+    records_dicts = [record.to_dict() for record in records]
+    return json.dumps(records_dicts, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _encode_compact(records: list) -> bytes:
+    return serializer.dumps(records)
+
+
+def _measure(name: str, build, encode, count: int, repeat: int) -> float:
+    best = float("inf")
+    size = 0
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        records = build(count)
+        size = len(encode(records))
+        best = min(best, time.perf_counter() - start)
+
+    print(f"{name:<10} {count / best:>12,.0f} records/s  {size / best / 1e6:>8.1f} MB/s  ({best * 1000:.1f} ms)")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    encoder = "orjson" if serializer.orjson is not None else "json (orjson not installed)"
+    print(f"Encoding {args.records} records, best of {args.repeat}, encoder: {encoder}")
+    print("Timings include record construction, as in the parse -> save path.")
+
+    legacy = _measure("legacy", _build_schema_records, _encode_legacy, args.records, args.repeat)
+    compact = _measure("compact", _build_compact_records, _encode_compact, args.records, args.repeat)
+
+    print(f"Speedup: {legacy / compact:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark the batch text filter.
+
+Compares the previous per-record path (whitespace collapse plus a strict
+``re.search`` for any Latin letter) with ``scraper.text_filter.TextFilter``,
+and reports how many texts each keeps.
+
+Usage:
+    python -m benchmarks.text_filter_benchmark [--texts N] [--dataset PATH] [--max-latin-ratio R]
+
+``--dataset`` runs over the ``text`` fields of a stored JSON dataset instead
+of synthetic posts. For the synthetic posts, the kept/dropped outcome and
+timing of each sample are printed first.
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+from scraper.text_filter import TextFilter
+from store import serializer
+
+SAMPLE_TEXTS = [
+    "Здраво на сите,  дали некој има искуство со ова?\n" * 10,
+    "Погледнете овде https://forum.femina.mk/threads/primer.123/ има повеќе информации. " * 5,
+    # Latin "OK" in Cyrillic prose, kept unless the post is very short
+    "Се е OK, благодарам за советот! " * 8,
+    "Здраво OK",
+    "This post is written entirely in English and should be dropped. " * 5,
+]
+
+
+def _filter_legacy(texts: list) -> list:
+    results = []
+    for text in texts:
+        text = " ".join(text.split())
+        results.append(None if re.search(r'[a-zA-Z]', text) else text)
+    return results
+
+
+def _outcome(result) -> str:
+    return "kept" if result is not None else "dropped"
+
+
+def _report_samples(text_filter: TextFilter, count: int, repeat: int) -> None:
+    legacy = _filter_legacy(SAMPLE_TEXTS)
+    batch, _ = text_filter.filter(SAMPLE_TEXTS)
+
+    print(f"Per-sample outcome and time for {count} copies (legacy / batch):")
+    for text, old, new in zip(SAMPLE_TEXTS, legacy, batch):
+        copies = [text] * count
+        old_time = _best_time(_filter_legacy, copies, repeat)
+        new_time = _best_time(text_filter.filter, copies, repeat)
+        print(
+            f"  {_outcome(old):>7} / {_outcome(new):<7}  {old_time * 1000:7.1f} / {new_time * 1000:7.1f} ms"
+            f"  {text[:40]!r}"
+        )
+
+
+def _best_time(run, texts: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(texts)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _measure(name: str, run, texts: list, repeat: int) -> float:
+    best = float("inf")
+    kept = 0
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = run(texts)
+        best = min(best, time.perf_counter() - start)
+        kept = sum(1 for text in results if text is not None)
+
+    print(f"{name:<8} {len(texts) / best:>12,.0f} texts/s  kept {kept}/{len(texts)}  ({best * 1000:.1f} ms)")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=100000)
+    parser.add_argument("--dataset", type=Path)
+    parser.add_argument("--max-latin-ratio", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.dataset:
+        texts = [record["text"] for record in serializer.loads(args.dataset.read_bytes())]
+    else:
+        texts = [SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)] for i in range(args.texts)]
+
+    text_filter = TextFilter(max_latin_ratio=args.max_latin_ratio)
+    print(f"Filtering {len(texts)} texts, best of {args.repeat}, max Latin ratio {args.max_latin_ratio}")
+
+    if not args.dataset:
+        _report_samples(text_filter, len(texts) // len(SAMPLE_TEXTS), args.repeat)
+
+    _measure("legacy", _filter_legacy, texts, args.repeat)
+    _measure("batch", lambda batch: text_filter.filter(batch)[0], texts, args.repeat)
+    print(f"Drops by reason: {dict(text_filter.filter(texts)[1])}")
+
+
+if __name__ == "__main__":
+    main()
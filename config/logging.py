@@ -1,12 +1,45 @@
+import atexit
+import json
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Optional
 
 from .scraper_settings import settings
 
+_listener: Optional[QueueListener] = None
+
+
+class JSONFormatter(logging.Formatter):
+    """Format log records as one JSON object per line.
+
+    Tracebacks are already merged into the message by ``QueueHandler.prepare()``.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        return json.dumps(entry, ensure_ascii=False)
+
 
 def setup_logging() -> None:
-    """Configure logging for the scraper based on settings.py."""
+    """Configure logging for the scraper based on settings.py.
+
+    Records are put on a queue by the calling thread and written by a
+    background listener thread, so console and file I/O never blocks the
+    event loop. The listener is flushed and stopped at exit.
+    """
+
+    global _listener
+
+    formatter = JSONFormatter() if settings.log_json else logging.Formatter(settings.log_format)
 
     handlers = [logging.StreamHandler(sys.stdout)]
 
@@ -16,8 +49,38 @@ def setup_logging() -> None:
 
         handlers.append(logging.FileHandler(settings.log_file_path))
 
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    _stop_listener()
+
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    # QueueHandler.prepare() merges the message and traceback when the record is
+    # logged; the listener's handlers then apply the configured format
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     logging.basicConfig(
         level=getattr(logging, settings.log_level.upper()),
-        format=settings.log_format,
-        handlers=handlers,
+        handlers=[queue_handler],
+        force=True,
     )
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background listener, if running."""
+
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+# Registered once here rather than in setup_logging(), which may run repeatedly
+atexit.register(_stop_listener)
@@ -8,18 +8,37 @@ class ScraperSettings(BaseSettings):
     log_format: str = "%(asctime)s %(levelname)s %(name)s | %(message)s"
     log_to_file: bool = True
     log_file_path: str = "logs/scraper.log"
+    log_json: bool = False  # One JSON object per line instead of log_format
+    log_progress_interval: float = 30.0  # Seconds between aggregate progress lines
 
     # Site details
     site_url: str = "https://forum.femina.mk/"
     site_name: str = "femina_forum"
 
+    # Thread discovery: "listing" paginates category pages, "sitemap" reads the forum sitemap
+    discovery_mode: str = "listing"
+    sitemap_path: str = "sitemap.xml"
+    sitemap_chunk_size: int = 20
+
+    # Text filtering: highest share of Latin letters (vs. Cyrillic) a kept post may have
+    max_latin_ratio: float = 0.2
+
     # Scraping settings
     max_concurrent_requests: int = 10
     request_timeout: int = 20
 
-    # Rate limiting
+    # Rate limiting (global, split evenly between active distributed workers)
     requests_per_second: float = 5
 
+    # Distributed crawling: workers share units of work through a SQLite lease table
+    distributed: bool = False
+    coordinator_db_path: str = "data/coordinator.sqlite"
+    coordinator_journal_mode: str = "DELETE"  # WAL is faster but only works when all workers share one host
+    worker_id: str = ""  # Defaults to "<hostname>-<pid>"
+    run_id: str = ""  # Empty joins the unfinished run, or starts a new one once the last run finished
+    lease_ttl: float = 600.0
+    heartbeat_interval: float = 60.0
+
     # Retry settings
     max_retries: int = 3
     retry_delay: float = 1.0
@@ -7,6 +7,14 @@ class JSONStoreConfig(BaseModel):
     data_dir: str = "data"
     records_filename_template: str = "{site_name}_dataset.json"
     seen_ids_filename_template: str = "{site_name}_seen_ids.json"
+    state_filename_template: str = "{site_name}_state.json"
+
+
+class SQLiteStoreConfig(BaseModel):
+    """Configuration for SQLite storage backend."""
+    data_dir: str = "data"
+    db_filename_template: str = "{site_name}.sqlite"
+    journal_mode: str = "DELETE"  # WAL is faster but only works when all workers share one host
 
 
 class StoreSettings(BaseSettings):
@@ -14,6 +22,7 @@ class StoreSettings(BaseSettings):
 
     backend: str = "json"
     json_store: JSONStoreConfig = JSONStoreConfig()
+    sqlite_store: SQLiteStoreConfig = SQLiteStoreConfig()
 
     model_config = {
         "env_file": ".env"
@@ -1,14 +1,22 @@
 import logging
 import asyncio
-from typing import Any, List, Optional, Dict
+import zlib
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, List, Optional, Dict, Set, Tuple
+from xml.etree import ElementTree
 import aiohttp
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
 from config.scraper_settings import settings
+from utils import ProgressReporter
 
 logger = logging.getLogger(__name__)
 
+# Errors worth retrying on a later run; other failures (e.g. 404 or an HTML page
+# served as a sitemap) would fail again every time
+TRANSIENT_ERRORS = (aiohttp.ClientPayloadError, aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
 
 class Fetcher:
     """Fetcher class for Femina forum using aiohttp."""
@@ -16,9 +24,33 @@ class Fetcher:
     def __init__(self):
         self.base_url = settings.site_url
         self.headers = settings.headers
+        self.requests_per_second = settings.requests_per_second
+        # Sitemaps that failed with a transient error; the last run time is not advanced while this is non-zero
+        self.failed_fetches = 0
+        # Sitemap thread URLs that failed with a transient error, to be retried on the next run
+        self.failed_urls: Set[str] = set()
+        # Per-URL lines are logged at DEBUG; this reports aggregate counts at INFO
+        self._progress = ProgressReporter(logger, "Fetch", interval=settings.log_progress_interval)
+
+    async def fetch_metadata(
+        self, since: Optional[datetime] = None, failed_urls: Optional[Set[str]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Fetch the units of work to crawl: forum categories, or sitemaps in sitemap mode.
+
+        ``since`` is the start of the last completed run; sitemaps not modified
+        since then are left out. In sitemap mode, ``failed_urls`` from earlier
+        runs are added as one more unit so their threads are fetched again.
+        """
+        if settings.discovery_mode == "sitemap":
+            sitemaps = await self._fetch_sitemap_index(since)
+            if sitemaps is not None and failed_urls:
+                sitemaps.append({
+                    "name": "Failed threads",
+                    "url": urljoin(self.base_url, settings.sitemap_path) + "#failed",
+                    "threads": sorted(failed_urls),
+                })
+            return sitemaps
 
-    async def fetch_metadata(self) -> Optional[List[Dict[str, str]]]:
-        """Fetch forum category URLs."""
         logger.info("Fetching forum categories from %s...", self.base_url)
         async with aiohttp.ClientSession(headers=self.headers) as session:
             async with session.get(self.base_url) as response:
@@ -55,21 +87,40 @@ class Fetcher:
                 logger.info("Found %d categories", len(categories))
                 return categories
 
-    async def fetch_data(self, seen_ids: set, metadata: List[Dict[str, str]]):
-        """Fetch thread HTML contents from all categories using a generator."""
+    async def fetch_data(self, seen_ids: set, metadata: List[Dict[str, str]], since: Optional[datetime] = None):
+        """Fetch thread HTML contents for the given metadata using a generator.
+
+        Threads are discovered either by paginating category listings or, when
+        ``discovery_mode`` is ``"sitemap"``, from the sitemaps in ``metadata``.
+        ``since`` is only used by the sitemap mode to skip threads that have
+        not been modified since the last run. Units with a ``threads`` list
+        retry those thread URLs directly.
+        """
         if not metadata:
             return
 
         async with aiohttp.ClientSession(headers=self.headers) as session:
-            for category in metadata:
-                # Skip "Kanta"
-                if "Канта" in category['name']:
-                    continue
-                    
-                logger.info("Processing category: %s (%s)", category['name'], category['url'])
-                async for page_threads in self._fetch_threads_from_category(session, category, seen_ids):
-                    if page_threads:
-                        yield page_threads
+            if settings.discovery_mode == "sitemap":
+                for sitemap in metadata:
+                    if "threads" in sitemap:
+                        logger.info("Retrying %d failed threads", len(sitemap['threads']))
+                        threads_iter = self._fetch_sitemap_threads(session, sitemap['threads'], seen_ids)
+                    else:
+                        threads_iter = self._fetch_threads_from_sitemap(session, sitemap, seen_ids, since)
+                    async for threads in threads_iter:
+                        yield threads
+            else:
+                for category in metadata:
+                    # Skip "Kanta"
+                    if "Канта" in category['name']:
+                        continue
+                        
+                    logger.info("Processing category: %s (%s)", category['name'], category['url'])
+                    async for page_threads in self._fetch_threads_from_category(session, category, seen_ids):
+                        if page_threads:
+                            yield page_threads
+
+        self._progress.report()
 
     async def _fetch_threads_from_category(self, session, category, seen_ids):
         """Paginate through category and fetch thread links, yielding per page."""
@@ -78,12 +129,14 @@ class Fetcher:
         
         while True:
             url = f"{category_url}page-{page}" if page > 1 else category_url
-            logger.info("Fetching thread list from: %s", url)
+            logger.debug("Fetching thread list from: %s", url)
             
             async with session.get(url) as response:
                 if response.status != 200:
                     logger.error("Failed to fetch category page %s: %s", url, response.status)
                     break
+
+                self._progress.increment("listing_pages")
                 
                 html = await response.text()
                 soup = BeautifulSoup(html, "html.parser")
@@ -95,7 +148,7 @@ class Fetcher:
                 for sel in thread_selectors:
                     thread_links = soup.select(sel)
                     if thread_links:
-                        logger.info("Found %d links with selector %s", len(thread_links), sel)
+                        logger.debug("Found %d links with selector %s", len(thread_links), sel)
                         break
                 
                 if not thread_links:
@@ -110,28 +163,15 @@ class Fetcher:
                         continue
                         
                     thread_url = urljoin(self.base_url, href)
-                    # Extract ID from URL
-                    parts = href.strip('/').split('.')
-                    thread_id = parts[-1] if len(parts) > 1 else href.strip('/').split('/')[-1]
+                    thread_id = self._extract_thread_id(href)
                     
                     if thread_id in seen_ids:
                         continue
                     
-                    # Fetch thread content
-                    logger.info("Fetching thread content: %s", thread_url)
-                    async with session.get(thread_url) as thread_resp:
-                        if thread_resp.status == 200:
-                            thread_html = await thread_resp.text()
-                            threads_this_page.append({
-                                "id": thread_id,
-                                "url": thread_url,
-                                "html": thread_html,
-                                "category": category['name']
-                            })
-                            new_threads_per_page += 1
-                    
-                    # Respect rate limits
-                    await asyncio.sleep(1 / settings.requests_per_second)
+                    thread = await self._fetch_thread(session, thread_id, thread_url, category['name'])
+                    if thread:
+                        threads_this_page.append(thread)
+                        new_threads_per_page += 1
                 
                 if threads_this_page:
                     yield threads_this_page
@@ -139,3 +179,196 @@ class Fetcher:
                 if new_threads_per_page == 0:
                     break
                 page += 1
+
+    async def _fetch_sitemap_index(self, since) -> Optional[List[Dict[str, str]]]:
+        """Read the sitemap index and return the child sitemaps modified since the last run."""
+        sitemap_url = urljoin(self.base_url, settings.sitemap_path)
+        logger.info("Reading sitemap index from: %s", sitemap_url)
+
+        child_sitemaps = []
+        has_entries = has_urls = False
+        async with aiohttp.ClientSession(headers=self.headers) as session:
+            async for kind, loc, lastmod in self._iter_sitemap(session, sitemap_url):
+                has_entries = True
+                if kind == "url":
+                    has_urls = True
+                elif self._modified_since(lastmod, since):
+                    child_sitemaps.append({"name": loc, "url": loc})
+
+        # Small forums may publish a plain urlset instead of an index
+        if not child_sitemaps and has_urls:
+            child_sitemaps.append({"name": sitemap_url, "url": sitemap_url})
+
+        if not has_entries:
+            logger.error("No entries found in sitemap %s", sitemap_url)
+            return None
+
+        logger.info("Found %d sitemaps to read", len(child_sitemaps))
+        return child_sitemaps
+
+    async def _fetch_threads_from_sitemap(self, session, sitemap, seen_ids, since):
+        """Read a sitemap and fetch its new or modified threads, yielding in chunks."""
+        logger.info("Reading sitemap: %s", sitemap['url'])
+        # Read the whole sitemap before fetching so its connection is not held open
+        thread_urls = [
+            loc async for kind, loc, lastmod in self._iter_sitemap(session, sitemap['url'])
+            if kind == "url" and self._modified_since(lastmod, since)
+        ]
+        async for threads in self._fetch_sitemap_threads(session, thread_urls, seen_ids):
+            yield threads
+
+    async def _fetch_sitemap_threads(self, session, urls, seen_ids):
+        """Fetch unseen thread URLs taken from a sitemap, yielding in chunks."""
+        candidates = []
+        for url in urls:
+            if '/threads/' not in url:
+                continue
+            thread_id = self._extract_thread_id(url)
+            if thread_id not in seen_ids:
+                candidates.append((thread_id, url))
+
+        logger.info("Sitemap lists %d new or modified threads", len(candidates))
+
+        threads = []
+        for thread_id, url in candidates:
+            thread = await self._fetch_thread(session, thread_id, url, None, retry_on_failure=True)
+            if thread:
+                threads.append(thread)
+            if len(threads) >= settings.sitemap_chunk_size:
+                yield threads
+                threads = []
+
+        if threads:
+            yield threads
+
+    async def _iter_sitemap(self, session, url) -> AsyncIterator[Tuple[str, str, Optional[str]]]:
+        """Stream a sitemap and yield ``(kind, loc, lastmod)`` per entry.
+
+        ``kind`` is ``"sitemap"`` for sitemap index entries and ``"url"`` for
+        page entries. Gzip-compressed sitemaps are detected by their magic bytes
+        and decompressed on the fly.
+        """
+        parser = ElementTree.XMLPullParser(events=("end",))
+        decompressor = None
+
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    logger.error("Failed to fetch sitemap %s: %s", url, response.status)
+                    if self._is_transient(response.status):
+                        self.failed_fetches += 1
+                    return
+
+                first_chunk = True
+                async for data in response.content.iter_chunked(64 * 1024):
+                    if first_chunk:
+                        if data[:2] == b"\x1f\x8b":
+                            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                        first_chunk = False
+                    if decompressor:
+                        data = decompressor.decompress(data)
+
+                    parser.feed(data)
+                    for entry in self._read_sitemap_events(parser):
+                        yield entry
+
+            if decompressor:
+                parser.feed(decompressor.flush())
+            parser.close()
+            for entry in self._read_sitemap_events(parser):
+                yield entry
+
+        except (ElementTree.ParseError, zlib.error) as e:
+            # A malformed sitemap (e.g. an HTML challenge page) should not abort the run
+            logger.error("Failed to read sitemap %s: %s", url, e)
+        except TRANSIENT_ERRORS as e:
+            logger.error("Failed to read sitemap %s: %r", url, e)
+            self.failed_fetches += 1
+
+    @staticmethod
+    def _read_sitemap_events(parser) -> List[Tuple[str, str, Optional[str]]]:
+        """Collect completed sitemap entries from the pull parser and free their elements."""
+        entries = []
+        for _, elem in parser.read_events():
+            kind = elem.tag.rsplit('}', 1)[-1]
+            if kind not in ("sitemap", "url"):
+                continue
+
+            loc = lastmod = None
+            for child in elem:
+                name = child.tag.rsplit('}', 1)[-1]
+                if name == "loc":
+                    loc = (child.text or "").strip()
+                elif name == "lastmod":
+                    lastmod = (child.text or "").strip()
+            elem.clear()
+
+            if loc:
+                entries.append((kind, loc, lastmod))
+        return entries
+
+    @staticmethod
+    def _modified_since(lastmod: Optional[str], since: Optional[datetime]) -> bool:
+        """Check whether a sitemap ``lastmod`` value is newer than ``since``."""
+        if since is None or not lastmod:
+            return True
+
+        try:
+            modified = datetime.fromisoformat(lastmod)
+        except ValueError:
+            return True
+
+        if modified.tzinfo is None:
+            modified = modified.replace(tzinfo=timezone.utc)
+        return modified >= since
+
+    async def _fetch_thread(
+        self, session, thread_id, thread_url, category, retry_on_failure: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch a single thread page, respecting the configured rate limit.
+
+        With ``retry_on_failure``, transient failures are added to
+        ``failed_urls`` so the thread can be fetched again on the next run.
+        """
+        thread = None
+        transient = False
+
+        logger.debug("Fetching thread content: %s", thread_url)
+        try:
+            async with session.get(thread_url) as thread_resp:
+                if thread_resp.status != 200:
+                    logger.debug("Failed to fetch thread %s: %s", thread_url, thread_resp.status)
+                    transient = self._is_transient(thread_resp.status)
+                    self._progress.increment("threads_failed")
+                else:
+                    thread_html = await thread_resp.text()
+                    self._progress.increment("threads_fetched")
+                    thread = {
+                        "id": thread_id,
+                        "url": thread_url,
+                        "html": thread_html,
+                        "category": category
+                    }
+        except TRANSIENT_ERRORS as e:
+            logger.debug("Failed to fetch thread %s: %r", thread_url, e)
+            transient = True
+            self._progress.increment("threads_failed")
+
+        if transient and retry_on_failure:
+            self.failed_urls.add(thread_url)
+
+        # Respect rate limits
+        await asyncio.sleep(1 / self.requests_per_second)
+        return thread
+
+    @staticmethod
+    def _is_transient(status: int) -> bool:
+        """Check whether an HTTP status is worth retrying on a later run."""
+        return status == 429 or status >= 500
+
+    @staticmethod
+    def _extract_thread_id(href: str) -> str:
+        """Extract the thread ID from a relative or absolute thread URL."""
+        path = urlparse(href).path.strip('/')
+        parts = path.split('.')
+        return parts[-1] if len(parts) > 1 else path.split('/')[-1]
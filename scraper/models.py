@@ -1,42 +1,90 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Optional, List
 
+from vezilka_schemas import RecordType
 
-@dataclass
+
+@dataclass(slots=True, kw_only=True)
+class RecordMeta:
+    """Metadata associated with a scraped record."""
+
+    source: str
+    url: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    labels: List[str] = field(default_factory=list)
+    scraped_at: datetime
+
+    def to_dict(self) -> dict:
+        """Serialize the RecordMeta into a JSON-safe dictionary."""
+
+        return {
+            "source": self.source,
+            "url": self.url,
+            "tags": self.tags,
+            "labels": self.labels,
+            "scraped_at": self.scraped_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RecordMeta":
+        """Deserialize a dictionary into a RecordMeta instance.
+
+        A missing ``scraped_at`` defaults to the current time.
+        """
+
+        return cls(
+            source=data.get("source", ""),
+            url=data.get("url"),
+            tags=data.get("tags") or [],
+            labels=data.get("labels") or [],
+            scraped_at=_parse_datetime(data.get("scraped_at")),
+        )
+
+
+@dataclass(slots=True)
 class Record:
-    """Represents a scraped record."""
+    """Represents a scraped record.
+
+    A slotted mirror of ``vezilka_schemas.Record`` used between the parser and
+    the store. It skips per-record pydantic validation and can be encoded
+    directly by orjson, while producing the same JSON layout.
+    """
 
     id: str
-    title: str
-    site_url: str
-    page_url: str
-    content: Optional[str] = None
-    published_at: Optional[str] = None
-    categories: List[str] = None
+    text: str
+    type: RecordType
+    last_modified_at: datetime
+    meta: RecordMeta
 
     def to_dict(self) -> dict:
-        """Serialize the Record into a dictionary."""
+        """Serialize the Record into a JSON-safe dictionary."""
 
         return {
             "id": self.id,
-            "title": self.title,
-            "site_url": self.site_url,
-            "page_url": self.page_url,
-            "content": self.content,
-            "published_at": self.published_at,
-            "categories": self.categories,
+            "text": self.text,
+            "type": self.type.value,
+            "last_modified_at": self.last_modified_at.isoformat(),
+            "meta": self.meta.to_dict(),
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Record":
-        """Deserialize a dictionary into a Record instance."""
+        """Deserialize a dictionary into a Record instance.
+
+        A missing ``last_modified_at`` defaults to the current time.
+        """
 
         return cls(
             id=data.get("id", ""),
-            title=data.get("title", ""),
-            site_url=data.get("site_url", ""),
-            page_url=data.get("page_url", ""),
-            content=data.get("content"),
-            published_at=data.get("published_at"),
-            categories=data.get("categories"),
-        )
\ No newline at end of file
+            text=data.get("text", ""),
+            type=RecordType(data.get("type", RecordType.NARRATIVE.value)),
+            last_modified_at=_parse_datetime(data.get("last_modified_at")),
+            meta=RecordMeta.from_dict(data.get("meta") or {}),
+        )
+
+
+def _parse_datetime(value: Optional[str]) -> datetime:
+    """Parse an ISO timestamp, defaulting to the current time like the parser does."""
+
+    return datetime.fromisoformat(value) if value else datetime.now()
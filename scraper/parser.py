@@ -1,9 +1,13 @@
-import re
 import logging
+from collections import Counter
 from typing import Any, List
 from bs4 import BeautifulSoup
 from datetime import datetime
-from vezilka_schemas import Record, RecordMeta, RecordType
+from vezilka_schemas import RecordType
+
+from config.scraper_settings import settings
+from .models import Record, RecordMeta
+from .text_filter import TextFilter
 
 logger = logging.getLogger(__name__)
 
@@ -12,19 +16,37 @@ class Parser:
     """Parser class for Femina forum threads."""
     
     def __init__(self):
-        pass
+        self._text_filter = TextFilter(max_latin_ratio=settings.max_latin_ratio)
+        # Discarded threads per reason, accumulated over all parsed chunks
+        self.drop_counts = Counter()
 
     def parse(self, raw_data: List[dict], metadata: Any = None) -> List[Record]:
-        """Parse thread raw data into structured Record objects."""
-        records = []
+        """Parse thread raw data into structured Record objects.
+
+        Post texts of the whole chunk are normalised and language-filtered in
+        one batch after extraction.
+        """
+        candidates = []
+        drops = Counter()
         
         for item in raw_data:
             thread_id = item['id']
             url = item['url']
             html = item['html']
-            category = item['category']
+
+            # Records need a non-empty ID; the URL may not contain one
+            if not thread_id:
+                drops["missing_id"] += 1
+                logger.warning("Could not extract a thread ID from %s", url)
+                continue
             
             soup = BeautifulSoup(html, "html.parser")
+
+            # Sitemap discovery does not know the category, so read it from the breadcrumbs
+            category = item['category'] or self._extract_category(soup)
+            if category and "Канта" in category:
+                drops["trash_category"] += 1
+                continue
             
             # Extract title
             title_selectors = ['.p-title-value', 'div.titleBar h1', '.thread-title', 'h1']
@@ -41,7 +63,7 @@ class Parser:
             for sel in post_selectors:
                 post_bodies = soup.select(sel)
                 if post_bodies:
-                    logger.info("Found %d post bodies with selector %s", len(post_bodies), sel)
+                    logger.debug("Found %d post bodies with selector %s", len(post_bodies), sel)
                     break
             
             if post_bodies:
@@ -50,40 +72,58 @@ class Parser:
                 
                 if not main_post_content:
                     main_post_content = BeautifulSoup(raw_post_html, "html.parser").get_text(separator=" ", strip=True)
-                
-                # Strict Cyrillic filtering: discard if Latin characters are found
-                if self._contains_latin(main_post_content):
-                    logger.warning("Discarding record %s: content contains Latin characters.", thread_id)
-                    continue
-
-                # Create metadata
-                record_meta = RecordMeta(
-                    source="https://forum.femina.mk/",
-                    url=url,
-                    tags=[category],
-                    labels=[],
-                    scraped_at=datetime.now()
-                )
-                
-                # Create record
-                records.append(Record(
-                    id=thread_id,
-                    text=main_post_content,
-                    type=RecordType.NARRATIVE,
-                    last_modified_at=datetime.now(),
-                    meta=record_meta
-                ))
+
+                candidates.append((thread_id, url, category, main_post_content))
             else:
+                drops["missing_post"] += 1
                 logger.warning("Could not find post content for thread %s. HTML snippet: %s", url, html[:500].replace('\n', ' '))
+
+        texts, filter_drops = self._text_filter.filter([candidate[3] for candidate in candidates])
+        drops.update(filter_drops)
+
+        records = []
+        for (thread_id, url, category, _), text in zip(candidates, texts):
+            if text is None:
+                continue
+
+            # Create metadata
+            record_meta = RecordMeta(
+                source="https://forum.femina.mk/",
+                url=url,
+                tags=[category] if category else [],
+                labels=[],
+                scraped_at=datetime.now()
+            )
+            
+            # Create record
+            records.append(Record(
+                id=thread_id,
+                text=text,
+                type=RecordType.NARRATIVE,
+                last_modified_at=datetime.now(),
+                meta=record_meta
+            ))
+
+        if drops:
+            logger.info("Discarded %d threads in chunk: %s", sum(drops.values()), dict(drops))
+            self.drop_counts.update(drops)
         
         return records
 
-    def _contains_latin(self, text: str) -> bool:
-        """Check if the text contains any Latin letters."""
-        return bool(re.search(r'[a-zA-Z]', text))
+    def _extract_category(self, soup: BeautifulSoup) -> str:
+        """Extract the innermost forum name from the thread breadcrumbs."""
+        breadcrumb_selectors = ['.p-breadcrumbs a', '.breadcrumb a', '.crumbs a']
+        for sel in breadcrumb_selectors:
+            crumbs = [a for a in soup.select(sel) if '/forums/' in (a.get('href') or '')]
+            if crumbs:
+                return crumbs[-1].text.strip()
+        return ""
 
     def _strip_html(self, raw_html: str) -> str:
-        """Convert HTML content into plain text by removing tags and normalizing whitespace."""
+        """Convert HTML content into plain text by removing tags and quotes.
+
+        Whitespace is normalised later by the batch text filter.
+        """
 
         if not raw_html:
             return ""
@@ -94,6 +134,4 @@ class Parser:
         for quote in soup.select('blockquote'):
             quote.decompose()
             
-        text = soup.get_text(separator=" ", strip=True)
-
-        return " ".join(text.split())
+        return soup.get_text(separator=" ", strip=True)
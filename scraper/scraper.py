@@ -1,8 +1,15 @@
+import asyncio
 import logging
+import os
+import socket
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
+from config import settings, store_settings
 from .fetcher import Fetcher
 from .parser import Parser
-from store import StoreFactory
+from store import LeaseStore, StoreFactory
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +24,9 @@ class Scraper:
         self._fetcher = Fetcher()
         self._parser = Parser()
         self._store = StoreFactory.create(self.site_name)
+        # Store and lease calls can wait up to the SQLite busy timeout, so they run on
+        # one thread of their own instead of stalling fetches and heartbeats
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="store")
 
     async def run(self):
         """Execute the full scraping pipeline."""
@@ -25,26 +35,216 @@ class Scraper:
         logger.info("Starting scraper for %s", self.site_url)
         logger.info("=" * 80)
 
-        logger.info("Loading previously seen IDs...")
-        seen_ids = self._store.load_seen_ids()
-
-        logger.info("Fetching metadata...")
-        metadata = await self._fetcher.fetch_metadata()
-        
-        logger.info("Fetching data and saving incrementally...")
-        async for chunk in self._fetcher.fetch_data(seen_ids=seen_ids, metadata=metadata):
-            logger.info("Parsing chunk of %d threads...", len(chunk))
-            parsed_records = self._parser.parse(chunk, metadata=metadata)
-            
-            if parsed_records:
-                logger.info("Saving %d new records...", len(parsed_records))
-                self._store.save_records(parsed_records)
-                # Update seen_ids in case scraper restarts
-                for record in parsed_records:
-                    seen_ids.add(record.id)
+        try:
+            if settings.distributed:
+                await self._run_distributed()
             else:
-                logger.info("No new records in this chunk")
-        
+                await self._run_single()
+        finally:
+            self._db_executor.shutdown()
+
+        if self._parser.drop_counts:
+            logger.info("Discarded threads by reason: %s", dict(self._parser.drop_counts))
+
         logger.info("=" * 80)
         logger.info("Scraping completed for %s", self.site_url)
         logger.info("=" * 80)
+
+    async def _run_single(self):
+        """Crawl every unit of work in this process."""
+
+        run_started_at = datetime.now(timezone.utc)
+
+        logger.info("Loading previously seen IDs...")
+        seen_ids = await self._run_in_db_thread(self._store.load_seen_ids)
+        last_run = await self._run_in_db_thread(self._store.load_last_run)
+        failed_urls = await self._run_in_db_thread(self._store.load_failed_urls)
+
+        logger.info("Fetching metadata (last run: %s)...", last_run or "never")
+        metadata = await self._fetcher.fetch_metadata(since=last_run, failed_urls=failed_urls)
+        if metadata is None:
+            logger.error("No metadata fetched, aborting run.")
+            return
+
+        logger.info("Fetching data and saving incrementally...")
+        async for chunk in self._fetcher.fetch_data(seen_ids=seen_ids, metadata=metadata, since=last_run):
+            await self._process_chunk(chunk, metadata, seen_ids)
+
+        await self._save_failed_urls(metadata)
+        await self._save_last_run(run_started_at, self._fetcher.failed_fetches)
+
+    async def _run_distributed(self):
+        """Crawl units of work leased from the shared coordinator database.
+
+        Every worker registers the same run, seeds its units of work and then
+        claims leases until all of them are done. The global request rate is
+        divided between the workers that are currently active.
+        """
+
+        if store_settings.backend.lower() == "json":
+            raise ValueError("Distributed crawling needs a store shared between processes; use the sqlite backend")
+
+        worker_id = settings.worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        leases = await self._run_in_db_thread(
+            LeaseStore, settings.coordinator_db_path, worker_id, settings.lease_ttl, settings.coordinator_journal_mode
+        )
+
+        try:
+            stored_last_run = await self._run_in_db_thread(self._store.load_last_run)
+            run_id, run_started_at, last_run = await self._run_in_db_thread(
+                leases.start_run, settings.run_id, datetime.now(timezone.utc), stored_last_run
+            )
+            logger.info("Worker %s joined run %s (last run: %s)", worker_id, run_id, last_run or "never")
+
+            logger.info("Fetching metadata...")
+            failed_urls = await self._run_in_db_thread(self._store.load_failed_urls)
+            metadata = await self._fetcher.fetch_metadata(since=last_run, failed_urls=failed_urls)
+            if metadata is None:
+                logger.error("No metadata fetched, aborting run.")
+                return
+            await self._run_in_db_thread(leases.add_leases, run_id, metadata)
+
+            while True:
+                unit = await self._run_in_db_thread(leases.claim, run_id)
+                if unit is None:
+                    if await self._run_in_db_thread(leases.is_finished, run_id):
+                        await self._run_in_db_thread(leases.finish_run, run_id, datetime.now(timezone.utc))
+                        break
+                    logger.info("Waiting for leases held by other workers...")
+                    await asyncio.sleep(settings.heartbeat_interval)
+                    continue
+
+                await self._process_lease(leases, run_id, unit, last_run)
+
+            failed_sitemaps = await self._run_in_db_thread(leases.run_failures, run_id)
+            await self._save_last_run(run_started_at, failed_sitemaps)
+        finally:
+            await self._run_in_db_thread(leases.close)
+
+    async def _process_lease(self, leases: LeaseStore, run_id: str, unit: dict, last_run):
+        """Crawl a single leased unit of work, keeping the lease alive meanwhile."""
+
+        logger.info("Claimed lease: %s", unit['url'])
+        await self._update_rate_limit(leases)
+        failures_before = self._fetcher.failed_fetches
+        self._fetcher.failed_urls.clear()
+        crawl = asyncio.create_task(self._crawl_unit(unit, last_run))
+        heartbeat = asyncio.create_task(self._heartbeat(leases, run_id, unit['url'], crawl))
+
+        try:
+            await crawl
+        except asyncio.CancelledError:
+            if self._lease_lost(heartbeat):
+                # The heartbeat stopped the crawl: another worker owns the unit now
+                logger.warning("Stopped crawling %s after losing its lease", unit['url'])
+                return
+            await self._run_in_db_thread(leases.release, run_id, unit['url'])
+            raise
+        except BaseException:
+            await self._run_in_db_thread(leases.release, run_id, unit['url'])
+            raise
+        finally:
+            heartbeat.cancel()
+            crawl.cancel()
+
+        if self._lease_lost(heartbeat):
+            logger.warning("Lease %s was lost before it could be completed", unit['url'])
+            return
+
+        # Recorded before completing, so the run is never seen as finished without them
+        await self._run_in_db_thread(leases.add_failures, run_id, self._fetcher.failed_fetches - failures_before)
+        await self._save_failed_urls([unit])
+        await self._run_in_db_thread(leases.complete, run_id, unit['url'])
+        logger.info("Completed lease: %s", unit['url'])
+
+    async def _crawl_unit(self, unit: dict, last_run):
+        """Fetch, parse and save all threads of a single unit of work."""
+
+        # Reload seen IDs so records saved by other workers are skipped
+        seen_ids = await self._run_in_db_thread(self._store.load_seen_ids)
+        async for chunk in self._fetcher.fetch_data(seen_ids=seen_ids, metadata=[unit], since=last_run):
+            await self._process_chunk(chunk, [unit], seen_ids)
+
+    async def _heartbeat(self, leases: LeaseStore, run_id: str, key: str, crawl: asyncio.Task) -> bool:
+        """Periodically extend a held lease and rebalance the rate limit.
+
+        Returns False after cancelling ``crawl`` if the lease was taken over
+        by another worker, so the unit is never crawled twice. Database errors
+        are logged and the lease is extended again on the next interval.
+        """
+
+        while True:
+            await asyncio.sleep(settings.heartbeat_interval)
+            try:
+                held = await self._run_in_db_thread(leases.heartbeat, run_id, key)
+                if held:
+                    await self._update_rate_limit(leases)
+            except sqlite3.Error as e:
+                logger.warning("Failed to extend lease %s, retrying in %ss: %s", key, settings.heartbeat_interval, e)
+                continue
+
+            if not held:
+                logger.warning("Lost lease %s to another worker", key)
+                crawl.cancel()
+                return False
+
+    @staticmethod
+    def _lease_lost(heartbeat: asyncio.Task) -> bool:
+        """Check whether the heartbeat stopped because the lease was taken over."""
+
+        return heartbeat.done() and not heartbeat.cancelled() and heartbeat.result() is False
+
+    async def _update_rate_limit(self, leases: LeaseStore):
+        """Give this worker its share of the global request rate."""
+
+        active_workers = await self._run_in_db_thread(leases.active_workers)
+        self._fetcher.requests_per_second = settings.requests_per_second / active_workers
+
+    async def _save_failed_urls(self, units):
+        """Store thread URLs that failed with a transient error, replacing the retried ones.
+
+        Sitemap discovery skips threads not modified since the last run, so
+        failed threads are retried from this list instead.
+        """
+
+        failed_urls = self._fetcher.failed_urls
+        retried_urls = {url for unit in units for url in unit.get('threads', [])}
+
+        await self._run_in_db_thread(self._store.remove_failed_urls, retried_urls - failed_urls)
+        await self._run_in_db_thread(self._store.save_failed_urls, set(failed_urls))
+
+    async def _save_last_run(self, run_started_at: datetime, failed_fetches: int):
+        """Advance the last run time, unless a sitemap could not be read.
+
+        The threads of an unread sitemap are unknown, so they can only be
+        fetched again by reading its entries since the previous last run time.
+        """
+
+        if failed_fetches:
+            logger.warning(
+                "%d sitemaps failed with transient errors; keeping the previous last run time so they are read again",
+                failed_fetches,
+            )
+            return
+
+        await self._run_in_db_thread(self._store.save_last_run, run_started_at)
+
+    async def _process_chunk(self, chunk, metadata, seen_ids):
+        """Parse a chunk of fetched threads and save the new records."""
+
+        logger.info("Parsing chunk of %d threads...", len(chunk))
+        parsed_records = self._parser.parse(chunk, metadata=metadata)
+
+        if parsed_records:
+            logger.info("Saving %d new records...", len(parsed_records))
+            await self._run_in_db_thread(self._store.save_records, parsed_records)
+            # Update seen_ids in case scraper restarts
+            for record in parsed_records:
+                seen_ids.add(record.id)
+        else:
+            logger.info("No new records in this chunk")
+
+    async def _run_in_db_thread(self, func, *args):
+        """Run a blocking store or lease call on the database thread."""
+
+        return await asyncio.get_running_loop().run_in_executor(self._db_executor, func, *args)
@@ -0,0 +1,85 @@
+import re
+from collections import Counter
+from typing import List, Optional, Tuple
+
+# Zero-width characters, soft hyphens and BOMs; str.split() already handles
+# non-breaking and other Unicode spaces when whitespace is collapsed
+INVISIBLE_CHARS = '\u00ad\u200b\u200c\u200d\u2060\ufeff'
+INVISIBLE_PATTERN = re.compile('[' + INVISIBLE_CHARS + ']')
+
+LATIN_LETTERS = r'A-Za-z\u00c0-\u00d6\u00d8-\u00f6\u00f8-\u024f'
+CYRILLIC_LETTERS = r'\u0400-\u052f'
+
+# Single characters rather than runs, so re can use its fast character scan.
+# Most posts contain neither Latin letters nor invisible characters, which
+# settles them with one scan and a Cyrillic check that stops at the first letter
+LATIN_OR_INVISIBLE_PATTERN = re.compile('[' + LATIN_LETTERS + INVISIBLE_CHARS + ']')
+CYRILLIC_PATTERN = re.compile('[' + CYRILLIC_LETTERS + ']')
+
+# Counts both scripts in one pass. URLs are not prose, so they are matched
+# before Latin runs and skipped; the lookahead lets re jump over non-letters
+SCRIPT_PATTERN = re.compile(
+    '(?=[' + LATIN_LETTERS + CYRILLIC_LETTERS + '])(?:'
+    '(?P<cyrillic>[' + CYRILLIC_LETTERS + ']+)'
+    r'|(?P<url>(?:https?://|www\.)\S+)'
+    '|(?P<latin>[' + LATIN_LETTERS + ']+))'
+)
+
+
+class TextFilter:
+    """Normalise post texts in batches and drop those not written in Cyrillic.
+
+    A text is kept when its Latin letters make up at most ``max_latin_ratio``
+    of its Latin and Cyrillic letters, ignoring URLs.
+    """
+
+    def __init__(self, max_latin_ratio: float):
+        self.max_latin_ratio = max_latin_ratio
+
+    def filter(self, texts: List[str]) -> Tuple[List[Optional[str]], Counter]:
+        """Normalise and filter a batch of texts.
+
+        Returns the normalised texts, with ``None`` in place of dropped ones,
+        and the number of dropped texts per reason.
+        """
+        drops = Counter()
+        results = []
+        max_ratio = self.max_latin_ratio
+
+        for text in texts:
+            has_latin = text and LATIN_OR_INVISIBLE_PATTERN.search(text)
+            if has_latin:
+                text = INVISIBLE_PATTERN.sub("", text)
+
+            text = " ".join(text.split()) if text else text
+            if not text:
+                reason = "empty"
+            elif not CYRILLIC_PATTERN.search(text):
+                reason = "no_cyrillic"
+            elif has_latin:
+                reason = self._latin_ratio_drop_reason(text, max_ratio)
+            else:
+                reason = None
+
+            if reason:
+                drops[reason] += 1
+                results.append(None)
+            else:
+                results.append(text)
+
+        return results, drops
+
+    @staticmethod
+    def _latin_ratio_drop_reason(text: str, max_ratio: float) -> Optional[str]:
+        """Return "latin_ratio" if too many letters of a Cyrillic text are Latin, else None."""
+        latin = cyrillic = 0
+        for match in SCRIPT_PATTERN.finditer(text):
+            group = match.lastgroup
+            if group == "cyrillic":
+                cyrillic += match.end() - match.start()
+            elif group == "latin":
+                latin += match.end() - match.start()
+
+        if latin / (latin + cyrillic) > max_ratio:
+            return "latin_ratio"
+        return None
@@ -1,9 +1,13 @@
 from .base_store import BaseStore
 from .json_store import JSONFileStore
+from .sqlite_store import SQLiteStore
+from .lease_store import LeaseStore
 from .factory import StoreFactory
 
 __all__ = [
     "BaseStore",
     "JSONFileStore",
+    "SQLiteStore",
+    "LeaseStore",
     "StoreFactory"
 ]
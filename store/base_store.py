@@ -1,8 +1,10 @@
 import logging
-from typing import Iterable, List, Set, Dict, Any
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterable, List, Optional, Set, Dict, Any
 from abc import ABC, abstractmethod
 
-from vezilka_schemas import Record
+if TYPE_CHECKING:
+    from scraper.models import Record
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +18,7 @@ class BaseStore(ABC):
         pass
 
     @abstractmethod
-    def save_records(self, records: List[Record]) -> None:
+    def save_records(self, records: List["Record"]) -> None:
         """Save a collection of scraped records to the store."""
         pass
 
@@ -30,6 +32,31 @@ class BaseStore(ABC):
         """Save the set of seen record IDs to the store."""
         pass
 
+    @abstractmethod
+    def load_last_run(self) -> Optional[datetime]:
+        """Load the start time of the last completed scraping run, if any."""
+        pass
+
+    @abstractmethod
+    def save_last_run(self, timestamp: datetime) -> None:
+        """Save the start time of a completed scraping run."""
+        pass
+
+    @abstractmethod
+    def load_failed_urls(self) -> Set[str]:
+        """Load the URLs of threads whose fetch failed and should be retried."""
+        pass
+
+    @abstractmethod
+    def save_failed_urls(self, urls: Set[str]) -> None:
+        """Add URLs of threads whose fetch failed to the retry list."""
+        pass
+
+    @abstractmethod
+    def remove_failed_urls(self, urls: Set[str]) -> None:
+        """Remove URLs that were fetched successfully from the retry list."""
+        pass
+
     @abstractmethod
     def clear(self) -> None:
         """Clear all stored records."""
@@ -2,6 +2,7 @@ from pathlib import Path
 from config import store_settings
 from . import BaseStore
 from .json_store import JSONFileStore
+from .sqlite_store import SQLiteStore
 
 
 class StoreFactory:
@@ -15,6 +16,8 @@ class StoreFactory:
 
         if backend == "json":
             return StoreFactory._create_json_store(site_name)
+        elif backend == "sqlite":
+            return StoreFactory._create_sqlite_store(site_name)
         else:
             raise ValueError(f"Unsupported store backend: {backend}")
 
@@ -29,8 +32,23 @@ class StoreFactory:
 
         records_filename = config.records_filename_template.format(site_name=site_name)
         seen_ids_filename = config.seen_ids_filename_template.format(site_name=site_name)
+        state_filename = config.state_filename_template.format(site_name=site_name)
 
         return JSONFileStore(
             records_file_path=str(data_dir / records_filename),
             seen_ids_file_path=str(data_dir / seen_ids_filename),
-        )
\ No newline at end of file
+            state_file_path=str(data_dir / state_filename),
+        )
+
+    @staticmethod
+    def _create_sqlite_store(site_name: str) -> SQLiteStore:
+        """Create a SQLite store with a site-specific database file."""
+
+        config = store_settings.sqlite_store
+
+        data_dir = Path(config.data_dir)
+        data_dir.mkdir(parents=True, exist_ok=True)
+
+        db_filename = config.db_filename_template.format(site_name=site_name)
+
+        return SQLiteStore(db_file_path=str(data_dir / db_filename), journal_mode=config.journal_mode)
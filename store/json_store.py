@@ -1,23 +1,29 @@
 import json
 import logging
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Set
-from vezilka_schemas import Record
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Set
 
+from . import serializer
 from .base_store import BaseStore
 
+if TYPE_CHECKING:
+    from scraper.models import Record
+
 logger = logging.getLogger(__name__)
 
 
 class JSONFileStore(BaseStore):
-    """JSON file storage with separate files for records and IDs."""
+    """JSON file storage with separate files for records, IDs and run state."""
 
-    def __init__(self, records_file_path: str, seen_ids_file_path: str):
+    def __init__(self, records_file_path: str, seen_ids_file_path: str, state_file_path: str):
         self.records_file_path = Path(records_file_path)
         self.seen_ids_file_path = Path(seen_ids_file_path)
+        self.state_file_path = Path(state_file_path)
 
         self.records_file_path.parent.mkdir(parents=True, exist_ok=True)
         self.seen_ids_file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.state_file_path.parent.mkdir(parents=True, exist_ok=True)
 
     def load_all_records(self) -> List[Dict[str, Any]]:
         """Load all records from the JSON file."""
@@ -26,26 +32,22 @@ class JSONFileStore(BaseStore):
             return []
 
         try:
-            with self.records_file_path.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            return serializer.loads(self.records_file_path.read_bytes())
         except json.JSONDecodeError:
             logger.warning("File %s is empty or corrupted. Returning empty list.", self.records_file_path)
             return []
 
-    def save_records(self, records: List[Record]) -> None:
+    def save_records(self, records: List["Record"]) -> None:
         """Append new records to the JSON file and update seen IDs."""
 
         if not records:
             logger.info("No records to save")
             return
 
-        records_dicts = [record.to_dict() for record in records]
-
         existing_records = self.load_all_records()
-        existing_records.extend(records_dicts)
+        existing_records.extend(records)
 
-        with self.records_file_path.open("w", encoding="utf-8") as f:
-            json.dump(existing_records, f, indent=2, ensure_ascii=False)
+        self.records_file_path.write_bytes(serializer.dumps(existing_records))
 
         logger.info("Saved %d new records (total: %d)", len(records), len(existing_records))
 
@@ -79,8 +81,74 @@ class JSONFileStore(BaseStore):
 
         logger.info("Added %d new IDs (total: %d)", len(ids), len(existing_ids))
 
+    def load_last_run(self) -> Optional[datetime]:
+        """Load the start time of the last completed run from the state file."""
+
+        last_run = self._load_state().get("last_run_at")
+        try:
+            return datetime.fromisoformat(last_run) if last_run else None
+        except ValueError:
+            logger.warning("File %s has an invalid last run time. Ignoring it.", self.state_file_path)
+            return None
+
+    def save_last_run(self, timestamp: datetime) -> None:
+        """Save the start time of a completed run to the state file."""
+
+        state = self._load_state()
+        state["last_run_at"] = timestamp.isoformat()
+        self._save_state(state)
+
+        logger.info("Recorded last run time: %s", timestamp.isoformat())
+
+    def load_failed_urls(self) -> Set[str]:
+        """Load the thread URLs to retry from the state file."""
+
+        return set(self._load_state().get("failed_urls", []))
+
+    def save_failed_urls(self, urls: Set[str]) -> None:
+        """Add thread URLs to the retry list in the state file."""
+
+        if not urls:
+            return
+
+        state = self._load_state()
+        state["failed_urls"] = sorted(set(state.get("failed_urls", [])) | urls)
+        self._save_state(state)
+
+        logger.info("Added %d failed thread URLs to retry (total: %d)", len(urls), len(state["failed_urls"]))
+
+    def remove_failed_urls(self, urls: Set[str]) -> None:
+        """Remove thread URLs from the retry list in the state file."""
+
+        if not urls:
+            return
+
+        state = self._load_state()
+        state["failed_urls"] = sorted(set(state.get("failed_urls", [])) - urls)
+        self._save_state(state)
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Load the run state file, or an empty state if it is missing or corrupted."""
+
+        if not self.state_file_path.exists():
+            return {}
+
+        try:
+            with self.state_file_path.open("r", encoding="utf-8") as f:
+                return json.load(f)
+
+        except json.JSONDecodeError:
+            logger.warning("File %s is empty or corrupted. Ignoring run state.", self.state_file_path)
+            return {}
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        """Write the run state file."""
+
+        with self.state_file_path.open("w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+
     def clear(self) -> None:
-        """Clear all stored records and seen IDs by deleting both files."""
+        """Clear all stored records, seen IDs and run state by deleting their files."""
 
         if self.records_file_path.exists():
             self.records_file_path.unlink()
@@ -89,3 +157,7 @@ class JSONFileStore(BaseStore):
         if self.seen_ids_file_path.exists():
             self.seen_ids_file_path.unlink()
             logger.info("Cleared seen IDs file: %s", self.seen_ids_file_path)
+
+        if self.state_file_path.exists():
+            self.state_file_path.unlink()
+            logger.info("Cleared state file: %s", self.state_file_path)
@@ -0,0 +1,219 @@
+import json
+import logging
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseStore:
+    """SQLite-backed lease table for coordinating several scraper workers.
+
+    Each run is split into units of work (categories or sitemaps) stored as
+    leases. Workers claim a pending or expired lease, extend it with
+    heartbeats while they work and mark it done afterwards, so a unit held by
+    a crashed worker is picked up again once its lease expires. Any process
+    that can open the database file can join the run.
+    """
+
+    def __init__(self, db_file_path: str, worker_id: str, lease_ttl: float, journal_mode: str = "DELETE"):
+        self.db_file_path = Path(db_file_path)
+        self.worker_id = worker_id
+        self.lease_ttl = lease_ttl
+
+        self.db_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Autocommit mode, so claims can use explicit BEGIN IMMEDIATE transactions
+        self._conn = sqlite3.connect(str(self.db_file_path), timeout=30, isolation_level=None)
+        # WAL needs shared memory on one host; keep the rollback journal for network filesystems
+        self._conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "run_id TEXT PRIMARY KEY, started_at TEXT NOT NULL, since TEXT, finished_at TEXT, "
+            "failures INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS leases ("
+            "run_id TEXT NOT NULL, key TEXT NOT NULL, payload TEXT NOT NULL, "
+            "status TEXT NOT NULL DEFAULT 'pending', owner TEXT, expires_at REAL, "
+            "PRIMARY KEY (run_id, key))"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS workers (worker_id TEXT PRIMARY KEY, last_seen REAL NOT NULL)")
+
+    def start_run(
+        self, run_id: Optional[str], started_at: datetime, since: Optional[datetime]
+    ) -> Tuple[str, datetime, Optional[datetime]]:
+        """Register a run, or join it if another worker already did.
+
+        Without a ``run_id`` the worker joins the latest unfinished run, or
+        starts a new one if every earlier run is finished. Returns the run ID
+        and the start time and last-run time recorded by the first worker, so
+        every worker of the run filters sitemaps the same way.
+        """
+
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            if not run_id:
+                run_id = self._unfinished_run_id(started_at) or f"run-{started_at:%Y%m%dT%H%M%S%f}"
+
+            self._conn.execute(
+                "INSERT OR IGNORE INTO runs (run_id, started_at, since) VALUES (?, ?, ?)",
+                (run_id, started_at.isoformat(), since.isoformat() if since else None),
+            )
+            stored_started_at, stored_since = self._conn.execute(
+                "SELECT started_at, since FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+        return (
+            run_id,
+            datetime.fromisoformat(stored_started_at),
+            datetime.fromisoformat(stored_since) if stored_since else None,
+        )
+
+    def add_failures(self, run_id: str, count: int) -> None:
+        """Add to the number of sitemaps that failed with a transient error in a run."""
+
+        if count:
+            self._conn.execute("UPDATE runs SET failures = failures + ? WHERE run_id = ?", (count, run_id))
+
+    def run_failures(self, run_id: str) -> int:
+        """Return the number of failed sitemaps recorded for a run by all workers."""
+
+        return self._conn.execute("SELECT failures FROM runs WHERE run_id = ?", (run_id,)).fetchone()[0]
+
+    def finish_run(self, run_id: str, finished_at: datetime) -> None:
+        """Mark a run as finished so the next worker to start begins a new run."""
+
+        self._conn.execute(
+            "UPDATE runs SET finished_at = ? WHERE run_id = ? AND finished_at IS NULL",
+            (finished_at.isoformat(), run_id),
+        )
+
+    def add_leases(self, run_id: str, units: List[Dict[str, str]]) -> None:
+        """Add units of work to a run, ignoring units that already exist."""
+
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO leases (run_id, key, payload) VALUES (?, ?, ?)",
+                [(run_id, unit['url'], json.dumps(unit, ensure_ascii=False)) for unit in units],
+            )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def claim(self, run_id: str) -> Optional[Dict[str, str]]:
+        """Claim a pending or expired lease and return its unit of work."""
+
+        now = time.time()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._conn.execute(
+                "SELECT key, payload, owner FROM leases WHERE run_id = ? "
+                "AND (status = 'pending' OR (status = 'leased' AND expires_at < ?)) "
+                "ORDER BY rowid LIMIT 1",
+                (run_id, now),
+            ).fetchone()
+
+            if row:
+                self._conn.execute(
+                    "UPDATE leases SET status = 'leased', owner = ?, expires_at = ? WHERE run_id = ? AND key = ?",
+                    (self.worker_id, now + self.lease_ttl, run_id, row[0]),
+                )
+            self._touch_worker(now)
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+        if not row:
+            return None
+
+        key, payload, previous_owner = row
+        if previous_owner:
+            logger.warning("Reclaimed expired lease %s from worker %s", key, previous_owner)
+        return json.loads(payload)
+
+    def heartbeat(self, run_id: str, key: str) -> bool:
+        """Extend a held lease. Returns False if the lease was lost to another worker."""
+
+        now = time.time()
+        cursor = self._conn.execute(
+            "UPDATE leases SET expires_at = ? WHERE run_id = ? AND key = ? AND owner = ? AND status = 'leased'",
+            (now + self.lease_ttl, run_id, key, self.worker_id),
+        )
+        self._touch_worker(now)
+        return cursor.rowcount > 0
+
+    def complete(self, run_id: str, key: str) -> None:
+        """Mark a held lease as done."""
+
+        self._conn.execute(
+            "UPDATE leases SET status = 'done', expires_at = NULL WHERE run_id = ? AND key = ? AND owner = ?",
+            (run_id, key, self.worker_id),
+        )
+
+    def release(self, run_id: str, key: str) -> None:
+        """Return a held lease to the pending pool so another worker can take it."""
+
+        self._conn.execute(
+            "UPDATE leases SET status = 'pending', owner = NULL, expires_at = NULL "
+            "WHERE run_id = ? AND key = ? AND owner = ? AND status = 'leased'",
+            (run_id, key, self.worker_id),
+        )
+
+    def is_finished(self, run_id: str) -> bool:
+        """Check whether every lease of the run is done."""
+
+        remaining = self._conn.execute(
+            "SELECT COUNT(*) FROM leases WHERE run_id = ? AND status != 'done'", (run_id,)
+        ).fetchone()[0]
+        return remaining == 0
+
+    def active_workers(self) -> int:
+        """Count workers that claimed or heartbeated within the lease TTL."""
+
+        count = self._conn.execute(
+            "SELECT COUNT(*) FROM workers WHERE last_seen >= ?", (time.time() - self.lease_ttl,)
+        ).fetchone()[0]
+        return max(count, 1)
+
+    def close(self) -> None:
+        """Close the database connection."""
+
+        self._conn.close()
+
+    def _unfinished_run_id(self, now: datetime) -> Optional[str]:
+        """Return the latest unfinished run, closing it first if all its leases are done."""
+
+        row = self._conn.execute(
+            "SELECT run_id FROM runs WHERE finished_at IS NULL ORDER BY started_at DESC LIMIT 1"
+        ).fetchone()
+        if not row:
+            return None
+
+        run_id = row[0]
+        total, remaining = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(status != 'done'), 0) FROM leases WHERE run_id = ?", (run_id,)
+        ).fetchone()
+
+        # A run with no leases is still being seeded by another worker
+        if total and not remaining:
+            self.finish_run(run_id, now)
+            return None
+        return run_id
+
+    def _touch_worker(self, now: float) -> None:
+        """Record that this worker is alive."""
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO workers (worker_id, last_seen) VALUES (?, ?)", (self.worker_id, now)
+        )
@@ -0,0 +1,46 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def _to_json_safe(obj: Any) -> Any:
+    """Fallback hook for objects the encoder does not handle natively."""
+
+    to_dict = getattr(obj, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(data: Any, indent: bool = True) -> bytes:
+    """Encode data as UTF-8 JSON, indented unless ``indent`` is False.
+
+    Uses orjson when installed, which encodes slotted ``Record`` dataclasses,
+    datetimes and enums directly without building intermediate dicts. Falls
+    back to the standard library encoder with ``to_dict()`` otherwise.
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else None
+        return orjson.dumps(data, default=_to_json_safe, option=option)
+
+    return json.dumps(
+        data,
+        default=_to_json_safe,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def loads(raw: bytes) -> Any:
+    """Decode UTF-8 JSON bytes."""
+
+    if orjson is not None:
+        return orjson.loads(raw)
+
+    return json.loads(raw)
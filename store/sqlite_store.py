@@ -0,0 +1,131 @@
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Set
+
+from . import serializer
+from .base_store import BaseStore
+
+if TYPE_CHECKING:
+    from scraper.models import Record
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteStore(BaseStore):
+    """SQLite storage that can be shared by several scraper processes.
+
+    Records and seen IDs are keyed by record ID, so concurrent workers writing
+    the same record never produce duplicates.
+    """
+
+    def __init__(self, db_file_path: str, journal_mode: str = "DELETE"):
+        self.db_file_path = Path(db_file_path)
+        self.db_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The scraper calls the store from a single database thread, not the one creating it
+        self._conn = sqlite3.connect(str(self.db_file_path), timeout=30, check_same_thread=False)
+        # WAL needs shared memory on one host; keep the rollback journal for network filesystems
+        self._conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS records (id TEXT PRIMARY KEY, data BLOB NOT NULL)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS seen_ids (id TEXT PRIMARY KEY)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS failed_urls (url TEXT PRIMARY KEY)")
+
+    def load_all_records(self) -> List[Dict[str, Any]]:
+        """Load all records in insertion order."""
+
+        rows = self._conn.execute("SELECT data FROM records ORDER BY rowid").fetchall()
+        return [serializer.loads(data) for (data,) in rows]
+
+    def save_records(self, records: List["Record"]) -> None:
+        """Insert records that are not stored yet and update seen IDs."""
+
+        if not records:
+            logger.info("No records to save")
+            return
+
+        with self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO records (id, data) VALUES (?, ?)",
+                [(record.id, serializer.dumps(record, indent=False)) for record in records],
+            )
+            saved = self._conn.total_changes - before
+
+        total = self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+        logger.info("Saved %d new records (total: %d)", saved, total)
+
+        self.save_seen_ids({record.id for record in records})
+
+    def load_seen_ids(self) -> Set[str]:
+        """Load the set of seen record IDs."""
+
+        ids = {row[0] for row in self._conn.execute("SELECT id FROM seen_ids")}
+        logger.info("Loaded %d previously seen IDs", len(ids))
+        return ids
+
+    def save_seen_ids(self, ids: Set[str]) -> None:
+        """Add new IDs to the seen IDs table."""
+
+        with self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO seen_ids (id) VALUES (?)", [(i,) for i in ids])
+
+        total = self._conn.execute("SELECT COUNT(*) FROM seen_ids").fetchone()[0]
+        logger.info("Added %d new IDs (total: %d)", len(ids), total)
+
+    def load_last_run(self) -> Optional[datetime]:
+        """Load the start time of the last completed run."""
+
+        row = self._conn.execute("SELECT value FROM state WHERE key = 'last_run_at'").fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def save_last_run(self, timestamp: datetime) -> None:
+        """Save the start time of a completed run."""
+
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO state (key, value) VALUES ('last_run_at', ?)",
+                (timestamp.isoformat(),),
+            )
+
+        logger.info("Recorded last run time: %s", timestamp.isoformat())
+
+    def load_failed_urls(self) -> Set[str]:
+        """Load the thread URLs to retry."""
+
+        return {row[0] for row in self._conn.execute("SELECT url FROM failed_urls")}
+
+    def save_failed_urls(self, urls: Set[str]) -> None:
+        """Add thread URLs to the retry list."""
+
+        if not urls:
+            return
+
+        with self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO failed_urls (url) VALUES (?)", [(url,) for url in urls])
+
+        total = self._conn.execute("SELECT COUNT(*) FROM failed_urls").fetchone()[0]
+        logger.info("Added %d failed thread URLs to retry (total: %d)", len(urls), total)
+
+    def remove_failed_urls(self, urls: Set[str]) -> None:
+        """Remove thread URLs from the retry list."""
+
+        if not urls:
+            return
+
+        with self._conn:
+            self._conn.executemany("DELETE FROM failed_urls WHERE url = ?", [(url,) for url in urls])
+
+    def clear(self) -> None:
+        """Clear all stored records, seen IDs, run state and failed URLs."""
+
+        with self._conn:
+            self._conn.execute("DELETE FROM records")
+            self._conn.execute("DELETE FROM seen_ids")
+            self._conn.execute("DELETE FROM state")
+            self._conn.execute("DELETE FROM failed_urls")
+
+        logger.info("Cleared SQLite store: %s", self.db_file_path)
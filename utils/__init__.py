@@ -1,12 +1,14 @@
 """
 Utility modules for web scraping.
-Contains retry logic, rate limiting, URL helpers, and date utilities.
+Contains retry logic, rate limiting, and progress reporting.
 """
 
 from .retry import retry_on_exception
 from .rate_limiter import RateLimiter
+from .progress import ProgressReporter
 
 __all__ = [
     'retry_on_exception',
     'RateLimiter',
+    'ProgressReporter',
 ]
@@ -0,0 +1,43 @@
+import logging
+import time
+from collections import Counter
+
+
+class ProgressReporter:
+    """Aggregate frequent events into periodic progress log lines.
+
+    Used instead of logging every URL: callers count events and a single INFO
+    line with the totals is emitted at most once per ``interval`` seconds.
+    """
+
+    def __init__(self, logger: logging.Logger, label: str, interval: float = 30.0):
+        self.logger = logger
+        self.label = label
+        self.interval = interval
+        self.counts = Counter()
+        self._reported = Counter()
+        self._last_report_time = time.monotonic()
+
+    def increment(self, key: str, amount: int = 1) -> None:
+        """Count an event and report if the interval has elapsed."""
+
+        self.counts[key] += amount
+
+        now = time.monotonic()
+        if now - self._last_report_time >= self.interval:
+            self.report(now)
+
+    def report(self, now: float = None) -> None:
+        """Log the totals and the change since the previous report."""
+
+        if self.counts == self._reported:
+            return
+
+        elapsed = (now or time.monotonic()) - self._last_report_time
+        summary = ", ".join(
+            f"{key}={count} (+{count - self._reported[key]})" for key, count in sorted(self.counts.items())
+        )
+        self.logger.info("%s progress over %.0fs: %s", self.label, elapsed, summary)
+
+        self._reported = self.counts.copy()
+        self._last_report_time = now or time.monotonic()